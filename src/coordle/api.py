@@ -1,16 +1,32 @@
 # src/coordle/api.py
 
-from typing import Dict
-
-from fastapi import FastAPI, HTTPException
+from collections import deque
+from datetime import date, datetime, time, timedelta, timezone
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, List
+import asyncio
+import json
+import math
+import threading
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 from pydantic import BaseModel
 import uuid
 
-from .config import GameConfig
-from .engine import CoordinateWordleEngine
-from .plotting import create_attempt_image
+from .config import server_config
+from .daily import (
+    COMMON_GUESSES,
+    LAUNCH_DATE,
+    DailyPuzzle,
+    daily_seed,
+    get_daily_puzzle,
+    today_utc,
+)
+from .engine import CoordinateWordleEngine, GuessResult
+from .limits import CostLimiter, FairScheduler, RateLimited
+from .plotting import DEFAULT_IMAGE_SIZE, IMAGE_MEDIA_TYPES, IMAGE_SIZES, create_attempt_image
 
 app = FastAPI()
 
@@ -26,11 +42,41 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    # so the frontend can read how long to back off after a 429
+    expose_headers=["Retry-After"],
 )
 
 # In-memory store: game_id to engine instance
 GAMES: Dict[str, CoordinateWordleEngine] = {}
 
+# Games untouched for GAME_IDLE_TTL seconds may be dropped to make room
+# for their owner's new ones. Beyond that a client (one address, which
+# may be a whole NAT) can hold MAX_GAMES_PER_CLIENT games; more get a 429
+# rather than deleting someone's live game.
+GAME_IDLE_TTL = 30 * 60
+MAX_GAMES_PER_CLIENT = 100
+_GAMES_BY_CLIENT: Dict[str, Deque[str]] = {}
+_GAME_LAST_USED: Dict[str, float] = {}
+_GAMES_LOCK = threading.Lock()
+
+# Each client gets EVAL_BUDGET seconds of evaluation/render CPU, refilled at
+# EVAL_REFILL s/s. All game work runs on EVAL_WORKERS threads, one task per
+# client in turn, so a single heavy client can't crowd out the rest.
+EVAL_BUDGET = 2.0
+EVAL_REFILL = 0.5
+EVAL_WORKERS = 2
+# creating a game costs ~0 CPU but holds memory, so it isn't free either
+NEW_GAME_COST = 0.05
+
+LIMITER = CostLimiter(capacity=EVAL_BUDGET, refill_rate=EVAL_REFILL)
+SCHEDULER = FairScheduler(LIMITER, workers=EVAL_WORKERS)
+
+# /stats exposes client addresses, keep it to the machine itself
+_LOCAL_HOSTS = {"127.0.0.1", "::1"}
+
+# past puzzles never change, so let browsers/CDNs keep them
+_IMMUTABLE = "public, max-age=31536000, immutable"
+
 
 # ---------- Pydantic models ----------
 
@@ -63,55 +109,184 @@ class GuessResponse(BaseModel):
     image_url: str | None = None
     attempts_left: int
     error: str | None = None
+    # function evaluations spent scoring this guess
+    n_evals: int = 0
+    # bound on how much closer the curve may get (non-zero only on an early hit)
+    dist_error: float = 0.0
     # optional here so the backend can choose when to reveal
     solution_point: Point | None = None
 
 
-# ---------- Endpoints ----------
-
-@app.post("/new-game", response_model=NewGameResponse)
-def new_game() -> NewGameResponse:
-    """
-    Create a new game instance and return its ID + basic config.
-    """
-    config = GameConfig()
-    engine = CoordinateWordleEngine(config=config)
-
-    game_id = str(uuid.uuid4())
-    GAMES[game_id] = engine
+class CommonGuess(BaseModel):
+    expr: str
+    dist: float
+    image_url: str
 
-    # target is usually a tuple (x, y) on the engine state
-    tx, ty = engine.state.target
 
-    return NewGameResponse(
-        game_id=game_id,
+class DailyResponse(BaseModel):
+    day: str
+    seed: int
+    x_min: float
+    x_max: float
+    max_attempts: int
+    eps: float
+    solution_point: Point
+    reference_expr: str
+    common_guesses: List[CommonGuess]
+
+
+# ---------- Helpers ----------
+
+def _client_id(conn: Request | WebSocket) -> str:
+    # behind a proxy, run uvicorn with --proxy-headers / --forwarded-allow-ips
+    # so this is the real address; never read X-Forwarded-For here, any
+    # client could send a fresh one per request and dodge the limiter
+    return conn.client.host if conn.client else "unknown"
+
+
+def _run_limited(
+    client_id: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    game_id: str | None = None,
+    min_cost: float = 0.0,
+) -> Any:
+    """Run fn on the fair scheduler, mapping RateLimited to a 429."""
+    try:
+        return SCHEDULER.run(client_id, fn, *args, game_id=game_id, min_cost=min_cost)
+    except RateLimited as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after))},
+        )
+
+
+def _make_engine(seed: int | None = None, daily: bool = False) -> CoordinateWordleEngine:
+    if daily:
+        seed = daily_seed(today_utc())
+    return CoordinateWordleEngine(config=server_config(), seed=seed)
+
+
+def _daily_response(puzzle: DailyPuzzle) -> DailyResponse:
+    config = server_config()
+    tx, ty = puzzle.target
+    day = puzzle.day.isoformat()
+
+    return DailyResponse(
+        day=day,
+        seed=puzzle.seed,
         x_min=config.x_min,
         x_max=config.x_max,
         max_attempts=config.max_attempts,
         eps=config.eps,
         solution_point=Point(x=tx, y=ty),
+        reference_expr=puzzle.reference_expr,
+        common_guesses=[
+            CommonGuess(
+                expr=expr,
+                dist=puzzle.common[expr].dist,
+                image_url=f"/daily/{day}/image/{i}",
+            )
+            for i, expr in enumerate(COMMON_GUESSES)
+        ],
     )
 
 
-@app.post("/guess", response_model=GuessResponse)
-def guess(payload: GuessRequest) -> GuessResponse:
-    """
-    Submit a function expression for a given game_id.
-    Returns distance and game state.
-    """
-    game = GAMES.get(payload.game_id)
+def _seconds_until_next_utc_day() -> int:
+    now = datetime.now(timezone.utc)
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), time(), tzinfo=timezone.utc)
+    return max(1, int((tomorrow - now).total_seconds()))
+
+
+def _parse_day(day: str) -> date:
+    try:
+        parsed = date.fromisoformat(day)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Day must be YYYY-MM-DD")
+    # don't hand out tomorrow's puzzle early
+    if parsed > today_utc():
+        raise HTTPException(status_code=404, detail="Puzzle not available yet")
+    if parsed < LAUNCH_DATE:
+        raise HTTPException(status_code=404, detail="No puzzle before launch")
+    return parsed
+
+
+
+def _store_game(client_id: str, game_id: str, engine: CoordinateWordleEngine) -> None:
+    now = monotonic()
+    with _GAMES_LOCK:
+        owned = _GAMES_BY_CLIENT.setdefault(client_id, deque())
+        for old_id in list(owned):
+            if now - _GAME_LAST_USED.get(old_id, 0.0) >= GAME_IDLE_TTL:
+                owned.remove(old_id)
+                GAMES.pop(old_id, None)
+                _GAME_LAST_USED.pop(old_id, None)
+
+        if len(owned) >= MAX_GAMES_PER_CLIENT:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many active games, finish or abandon one first",
+                headers={"Retry-After": "60"},
+            )
+
+        GAMES[game_id] = engine
+        _GAME_LAST_USED[game_id] = now
+        owned.append(game_id)
+
+
+def _get_game(game_id: str) -> CoordinateWordleEngine:
+    game = GAMES.get(game_id)
     if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
+    # keeps the game from being treated as abandoned
+    _GAME_LAST_USED[game_id] = monotonic()
+    return game
 
-    result = game.submit_guess(payload.expr)
 
-    attempt_index = len(game.state.attempts) - 1
-    image_url = (
-        f"/image/{payload.game_id}/{attempt_index}"
-        if result.error is None
-        else None
+def _render_daily(puzzle: DailyPuzzle, guess_index: int, size: int, fmt: str) -> bytes:
+    key = (guess_index, size, fmt)
+    img_bytes = puzzle.images.get(key)
+    if img_bytes is not None:
+        return img_bytes
+
+    attempt = puzzle.common[COMMON_GUESSES[guess_index]]
+    img_bytes = create_attempt_image(
+        expr=attempt.expr,
+        target=puzzle.target,
+        x_at_min=attempt.x_at_min,
+        y_at_min=attempt.y_at_min,
+        config=server_config(),
+        show_target=True,
+        size=size,
+        fmt=fmt,
+        cache=False,
+    )
+    # a concurrent render of the same key just stores identical bytes
+    return puzzle.images.setdefault(key, img_bytes)
+
+
+def _new_game_response(game_id: str, engine: CoordinateWordleEngine) -> NewGameResponse:
+    config = engine.config
+
+    # target is usually a tuple (x, y) on the engine state
+    tx, ty = engine.state.target
+
+    return NewGameResponse(
+        game_id=game_id,
+        x_min=config.x_min,
+        x_max=config.x_max,
+        max_attempts=config.max_attempts,
+        eps=config.eps,
+        solution_point=Point(x=tx, y=ty),
     )
 
+
+def _guess_response(
+    game: CoordinateWordleEngine,
+    result: GuessResult,
+    image_url: str | None,
+) -> GuessResponse:
     finished = game.is_finished()
     attempts_used = len(game.state.attempts)
     attempts_left = game.remaining_attempts()
@@ -130,16 +305,122 @@ def guess(payload: GuessRequest) -> GuessResponse:
         attempts_used=attempts_used,
         attempts_left=attempts_left,
         error=result.error,
+        n_evals=result.n_evals,
+        dist_error=result.dist_error,
         image_url=image_url,
         solution_point=solution_point,
     )
 
 
+def _render_attempt(
+    game: CoordinateWordleEngine,
+    attempt: GuessResult,
+    size: int = DEFAULT_IMAGE_SIZE,
+    fmt: str = "png",
+) -> bytes:
+    return create_attempt_image(
+        expr=attempt.expr,
+        target=game.state.target,
+        x_at_min=attempt.x_at_min,
+        y_at_min=attempt.y_at_min,
+        config=game.config,
+        show_target=True,  # always show the hidden point visually
+        size=size,
+        fmt=fmt,
+    )
+
+
+def _image_params_error(size: int, fmt: str) -> str | None:
+    if size not in IMAGE_SIZES:
+        return f"size must be one of {list(IMAGE_SIZES)}"
+    if not isinstance(fmt, str) or fmt not in IMAGE_MEDIA_TYPES:
+        return f"fmt must be one of {list(IMAGE_MEDIA_TYPES)}"
+    return None
+
+
+def _check_image_params(size: int, fmt: str) -> None:
+    error = _image_params_error(size, fmt)
+    if error is not None:
+        raise HTTPException(status_code=400, detail=error)
+
+
+def _ws_payload(kind: str, model: BaseModel) -> dict:
+    # go through model_dump_json so inf/nan distances become null, like HTTP
+    return {"type": kind, **json.loads(model.model_dump_json())}
+
+
+async def _ws_receive(websocket: WebSocket) -> Dict[str, Any] | None:
+    # receive_json() raises on binary frames and bad JSON, which would
+    # drop the whole game; None lets the caller answer with an error frame
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    text = message.get("text")
+    if text is None:
+        return None
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# ---------- Endpoints ----------
+
+@app.post("/new-game", response_model=NewGameResponse)
+def new_game(request: Request, seed: int | None = None, daily: bool = False) -> NewGameResponse:
+    """
+    Create a new game instance and return its ID + basic config.
+    Pass `seed` for a reproducible target, or `daily=true` for today's puzzle.
+    """
+    client_id = _client_id(request)
+    game_id = str(uuid.uuid4())
+    engine = _run_limited(
+        client_id, _make_engine, seed, daily, game_id=game_id, min_cost=NEW_GAME_COST
+    )
+
+    _store_game(client_id, game_id, engine)
+
+    return _new_game_response(game_id, engine)
+
+
+@app.post("/guess", response_model=GuessResponse)
+def guess(payload: GuessRequest, request: Request) -> GuessResponse:
+    """
+    Submit a function expression for a given game_id.
+    Returns distance and game state.
+    """
+    game = _get_game(payload.game_id)
+
+    result = _run_limited(
+        _client_id(request), game.submit_guess, payload.expr, game_id=payload.game_id
+    )
+
+    attempt_index = len(game.state.attempts) - 1
+    image_url = (
+        f"/image/{payload.game_id}/{attempt_index}"
+        if result.error is None
+        else None
+    )
+
+    return _guess_response(game, result, image_url)
+
+
 @app.get("/image/{game_id}/{attempt_index}")
-def attempt_image(game_id: str, attempt_index: int):
-    game = GAMES.get(game_id)
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
+def attempt_image(
+    request: Request,
+    game_id: str,
+    attempt_index: int,
+    size: int = DEFAULT_IMAGE_SIZE,
+    fmt: str = "png",
+):
+    """
+    Render one attempt. `size` is one of IMAGE_SIZES (px, square) and
+    `fmt` one of png / webp / svg.
+    """
+    _check_image_params(size, fmt)
+
+    game = _get_game(game_id)
 
     attempts = game.state.attempts
     if attempt_index < 0 or attempt_index >= len(attempts):
@@ -150,13 +431,174 @@ def attempt_image(game_id: str, attempt_index: int):
     if attempt.error:
         raise HTTPException(status_code=400, detail="No image for an invalid expression")
 
-    img_bytes = create_attempt_image(
-        expr=attempt.expr,
-        target=game.state.target,
-        x_at_min=attempt.x_at_min,
-        y_at_min=attempt.y_at_min,
-        config=game.config,
-        show_target=True,  # always show the hidden point visually
+    img_bytes = _run_limited(
+        _client_id(request), _render_attempt, game, attempt, size, fmt, game_id=game_id
+    )
+
+    # an attempt never changes once made
+    return Response(
+        content=img_bytes,
+        media_type=IMAGE_MEDIA_TYPES[fmt],
+        headers={"Cache-Control": "private, max-age=86400, immutable"},
+    )
+
+
+@app.get("/daily", response_model=DailyResponse)
+def daily(request: Request, response: Response) -> DailyResponse:
+    """
+    Today's shared puzzle: target, reference solution and results for
+    common opening guesses. Cached until the next UTC day.
+    """
+    puzzle = _run_limited(_client_id(request), get_daily_puzzle, today_utc())
+    response.headers["Cache-Control"] = f"public, max-age={_seconds_until_next_utc_day()}"
+    return _daily_response(puzzle)
+
+
+@app.get("/daily/{day}", response_model=DailyResponse)
+def daily_for_day(day: str, request: Request, response: Response) -> DailyResponse:
+    # building an uncached day costs real evaluation time, charge it
+    puzzle = _run_limited(_client_id(request), get_daily_puzzle, _parse_day(day))
+    if puzzle.day == today_utc():
+        response.headers["Cache-Control"] = f"public, max-age={_seconds_until_next_utc_day()}"
+    else:
+        response.headers["Cache-Control"] = _IMMUTABLE
+    return _daily_response(puzzle)
+
+
+@app.get("/daily/{day}/image/{guess_index}")
+def daily_image(
+    request: Request,
+    day: str,
+    guess_index: int,
+    size: int = DEFAULT_IMAGE_SIZE,
+    fmt: str = "png",
+):
+    _check_image_params(size, fmt)
+    client_id = _client_id(request)
+    puzzle = _run_limited(client_id, get_daily_puzzle, _parse_day(day))
+
+    if guess_index < 0 or guess_index >= len(COMMON_GUESSES):
+        raise HTTPException(status_code=404, detail="Guess not found")
+
+    img_bytes = _run_limited(client_id, _render_daily, puzzle, guess_index, size, fmt)
+
+    # the image is fully determined by the day, index, size and format
+    return Response(
+        content=img_bytes,
+        media_type=IMAGE_MEDIA_TYPES[fmt],
+        headers={"Cache-Control": _IMMUTABLE},
+    )
+
+
+@app.get("/stats")
+def stats(request: Request) -> Dict[str, Any]:
+    """
+    Who is spending evaluation time and who is being throttled,
+    heaviest clients first, plus the most expensive games.
+    Lists client addresses and game ids, so it is only served locally.
+    """
+    if _client_id(request) not in _LOCAL_HOSTS:
+        raise HTTPException(status_code=403, detail="Stats are only available locally")
+    return LIMITER.snapshot()
+
+
+@app.websocket("/ws/game")
+async def game_socket(websocket: WebSocket) -> None:
+    """
+    One game session per connection, without the GAMES lookup per turn.
+
+    Protocol (JSON text frames from the client):
+      {"type": "new-game"}            -> new-game payload
+                                          (optional "seed" / "daily")
+      {"type": "guess", "expr": "..."} -> guess payload, then the attempt
+                                          image as a binary frame (valid
+                                          expressions only); optional
+                                          "size" / "fmt" as for /image
+    A game is started automatically when the socket opens.
+    """
+    await websocket.accept()
+    client_id = _client_id(websocket)
+
+    async def run_limited(fn: Callable[..., Any], *args: Any, min_cost: float = 0.0) -> Any:
+        # CPU-bound work goes through the fair scheduler, off the event loop
+        return await asyncio.wrap_future(
+            SCHEDULER.submit(client_id, fn, *args, game_id=game_id, min_cost=min_cost)
+        )
+
+    game_id = str(uuid.uuid4())
+    try:
+        engine = await run_limited(_make_engine, min_cost=NEW_GAME_COST)
+    except RateLimited as e:
+        await websocket.send_json(
+            {"type": "error", "error": str(e), "retry_after": e.retry_after}
+        )
+        await websocket.close(code=1013)  # try again later
+        return
+    await websocket.send_json(
+        _ws_payload("new-game", _new_game_response(game_id, engine))
     )
 
-    return Response(content=img_bytes, media_type="image/png")
+    try:
+        while True:
+            message = await _ws_receive(websocket)
+            if message is None:
+                await websocket.send_json(
+                    {"type": "error", "error": "Expected a JSON object in a text frame"}
+                )
+                continue
+            kind = message.get("type")
+
+            if kind == "new-game":
+                seed = message.get("seed")
+                try:
+                    engine = await run_limited(
+                        _make_engine,
+                        seed if isinstance(seed, int) else None,
+                        bool(message.get("daily")),
+                        min_cost=NEW_GAME_COST,
+                    )
+                except RateLimited as e:
+                    await websocket.send_json(
+                        {"type": "error", "error": str(e), "retry_after": e.retry_after}
+                    )
+                    continue
+                game_id = str(uuid.uuid4())
+                await websocket.send_json(
+                    _ws_payload("new-game", _new_game_response(game_id, engine))
+                )
+                continue
+
+            if kind != "guess":
+                await websocket.send_json({"type": "error", "error": "Unknown message type"})
+                continue
+
+            if engine.is_finished():
+                await websocket.send_json({"type": "error", "error": "Game already finished"})
+                continue
+
+            expr = message.get("expr")
+            if not isinstance(expr, str):
+                await websocket.send_json({"type": "error", "error": "Missing expression"})
+                continue
+
+            size = message.get("size", DEFAULT_IMAGE_SIZE)
+            fmt = message.get("fmt", "png")
+            params_error = _image_params_error(size, fmt)
+            if params_error is not None:
+                await websocket.send_json({"type": "error", "error": params_error})
+                continue
+
+            try:
+                result = await run_limited(engine.submit_guess, expr)
+                payload = _guess_response(engine, result, image_url=None)
+                await websocket.send_json(_ws_payload("guess", payload))
+
+                if result.error is None:
+                    img_bytes = await run_limited(_render_attempt, engine, result, size, fmt)
+                    await websocket.send_bytes(img_bytes)
+            except RateLimited as e:
+                await websocket.send_json(
+                    {"type": "error", "error": str(e), "retry_after": e.retry_after}
+                )
+    except WebSocketDisconnect:
+        pass
@@ -12,6 +12,7 @@ class GameConfig:
     eps: float = 0.2  # win threshold (feeling bit generous today)
     point_min: float = -10.0
     point_max: float = 10.0
+    progressive: bool = False  # branch-and-bound scoring, early exit on hits
 
 @dataclass
 class GameConfig:
@@ -23,3 +24,9 @@ class GameConfig:
     point_min: float = -10.0
     point_max: float = 10.0
     dev_reveal: bool = False  # show target at start if True
+    progressive: bool = False  # branch-and-bound scoring, early exit on hits
+
+
+def server_config() -> GameConfig:
+    """Config for hosted games: API sessions and the shared daily puzzles."""
+    return GameConfig(progressive=True)
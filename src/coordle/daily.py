@@ -0,0 +1,88 @@
+# src/coordle/daily.py
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Dict, Tuple
+import hashlib
+
+from .config import server_config
+from .engine import CoordinateWordleEngine, GuessResult
+
+
+# first day with a daily puzzle; earlier dates are not served
+LAUNCH_DATE = date(2025, 1, 1)
+
+# Guesses most players open with. Their results (and images, see api.py)
+# are computed once per puzzle and shared by everyone.
+COMMON_GUESSES: Tuple[str, ...] = (
+    "0",
+    "x",
+    "-x",
+    "x**2",
+    "sin(x)",
+    "cos(x)",
+)
+
+
+@dataclass(frozen=True)
+class DailyPuzzle:
+    day: date
+    seed: int
+    target: Tuple[float, float]
+    reference_expr: str
+    reference: GuessResult
+    common: Dict[str, GuessResult]
+    # rendered common-guess images by (guess index, size, fmt), filled in
+    # by api.py; kept here so they live exactly as long as the puzzle
+    images: Dict[Tuple[int, int, str], bytes] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+
+def today_utc() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def daily_seed(day: date) -> int:
+    """
+    Stable seed for a calendar day.
+    Uses sha256 rather than hash() so it survives restarts / PYTHONHASHSEED.
+    """
+    digest = hashlib.sha256(f"coordle:{day.isoformat()}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _evaluate(target: Tuple[float, float], expr: str) -> GuessResult:
+    # throwaway engine so every guess is scored in isolation,
+    # with the same config players' games use
+    engine = CoordinateWordleEngine(config=server_config())
+    engine.state.target = target
+    return engine.submit_guess(expr)
+
+
+@lru_cache(maxsize=8)
+def get_daily_puzzle(day: date) -> DailyPuzzle:
+    """
+    Build (once) the shared data for a day's puzzle:
+      - target, drawn from the same seed a /new-game?daily=true engine uses
+      - a reference solution (horizontal line through the target)
+      - scored results for COMMON_GUESSES
+    `day` is required (no "today" default) so the cache key is always a date.
+    """
+    seed = daily_seed(day)
+    target = CoordinateWordleEngine(config=server_config(), seed=seed).state.target
+
+    reference_expr = f"{target[1]:.6f}"
+    reference = _evaluate(target, reference_expr)
+    common = {expr: _evaluate(target, expr) for expr in COMMON_GUESSES}
+
+    return DailyPuzzle(
+        day=day,
+        seed=seed,
+        target=target,
+        reference_expr=reference_expr,
+        reference=reference,
+        common=common,
+    )
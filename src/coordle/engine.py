@@ -6,8 +6,8 @@ from typing import List, Tuple, Optional
 import random
 
 from .config import GameConfig
-from .functions import build_function, FunctionParseError
-from .geometry import min_distance_curve_to_point
+from .functions import build_function, build_range_function, FunctionParseError
+from .geometry import min_distance_curve_to_point, progressive_min_distance
 
 
 @dataclass
@@ -19,7 +19,8 @@ class GuessResult:
     error: Optional[str] = None
     x_at_min: Optional[float] = None
     y_at_min: Optional[float] = None
-
+    n_evals: int = 0  # how many times f(x) was evaluated for this guess
+    dist_error: float = 0.0  # how much closer the curve may get (early hit only)
 
 
 @dataclass
@@ -32,9 +33,15 @@ class GameState:
 
 
 class CoordinateWordleEngine:
-    def __init__(self, config: Optional[GameConfig] = None, rng: Optional[random.Random] = None):
+    def __init__(
+        self,
+        config: Optional[GameConfig] = None,
+        rng: Optional[random.Random] = None,
+        seed: Optional[int] = None,
+    ):
+        # same seed (and config) -> same target, so puzzles can be shared
         self.config = config or GameConfig()
-        self.rng = rng or random.Random()
+        self.rng = rng or random.Random(seed)
         self.state = self._init_state()
 
     def _init_state(self) -> GameState:
@@ -75,14 +82,27 @@ class CoordinateWordleEngine:
             self._record_attempt(gr)
             return gr
 
-        dist, x_at_min, y_at_min = min_distance_curve_to_point(
-            f,
-            self.state.target,
-            self.config.x_min,
-            self.config.x_max,
-            self.config.n_samples,
-        )
-
+        if self.config.progressive:
+            est = progressive_min_distance(
+                f,
+                self.state.target,
+                self.config.x_min,
+                self.config.x_max,
+                self.config.n_samples,
+                eps=self.config.eps,
+                f_range=build_range_function(expr),
+            )
+            dist, x_at_min, y_at_min = est.dist, est.x_at_min, est.y_at_min
+            n_evals, dist_error = est.n_evals, est.error_bound
+        else:
+            dist, x_at_min, y_at_min = min_distance_curve_to_point(
+                f,
+                self.state.target,
+                self.config.x_min,
+                self.config.x_max,
+                self.config.n_samples,
+            )
+            n_evals, dist_error = self.config.n_samples, 0.0
 
         best_prev = self._best_dist_or_inf()
         best_dist = min(best_prev, dist)
@@ -95,6 +115,8 @@ class CoordinateWordleEngine:
             hit=hit,
             x_at_min=x_at_min,
             y_at_min=y_at_min,
+            n_evals=n_evals,
+            dist_error=dist_error,
         )
         self._record_attempt(gr)
         return gr
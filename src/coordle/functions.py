@@ -2,7 +2,7 @@
 
 import ast
 import math
-from typing import Callable, Any
+from typing import Callable, Any, Optional, Tuple
 
 
 _ALLOWED_FUNCS = {
@@ -22,6 +22,14 @@ _ALLOWED_NAMES = {
 }
 
 
+# (lo, hi) enclosure of f over an x-interval, or None when f is defined
+# nowhere on it. Infinite ends mean "unbounded / unknown on that side".
+Interval = Optional[Tuple[float, float]]
+
+_INF = float("inf")
+_UNBOUNDED = (-_INF, _INF)
+
+
 class FunctionParseError(Exception):
     """Raised when the expression is not allowed or cannot be parsed."""
     pass
@@ -207,6 +215,172 @@ class SafeEvaluator(ast.NodeVisitor):
             return float(self._eval(self.tree, x))
         return f
 
+    # --- interval evaluation ---
+
+    def _eval_range(self, node: ast.AST, lo: float, hi: float) -> Interval:
+        """
+        Enclosure of the expression for x in [lo, hi], covering every x
+        where point evaluation succeeds. Loose is fine, too tight is not.
+        """
+        if isinstance(node, ast.Expression):
+            return self._eval_range(node.body, lo, hi)
+
+        if isinstance(node, ast.Constant):
+            return (float(node.value), float(node.value))
+
+        if isinstance(node, ast.Name):
+            return (lo, hi)
+
+        if isinstance(node, ast.IfExp):
+            # either branch may be taken, so cover both
+            body = self._eval_range(node.body, lo, hi)
+            orelse = self._eval_range(node.orelse, lo, hi)
+            if body is None:
+                return orelse
+            if orelse is None:
+                return body
+            return (min(body[0], orelse[0]), max(body[1], orelse[1]))
+
+        if isinstance(node, ast.UnaryOp):
+            r = self._eval_range(node.operand, lo, hi)
+            if r is None or isinstance(node.op, ast.UAdd):
+                return r
+            return (-r[1], -r[0])
+
+        if isinstance(node, ast.BinOp):
+            a = self._eval_range(node.left, lo, hi)
+            b = self._eval_range(node.right, lo, hi)
+            if a is None or b is None:
+                return None
+            return _checked(_binop_range(node.op, a, b))
+
+        if isinstance(node, ast.Call):
+            args = [self._eval_range(arg, lo, hi) for arg in node.args]
+            if any(r is None for r in args):
+                return None
+            if len(args) != 1:
+                # wrong arity fails at every point too
+                return None
+            return _checked(_call_range(node.func.id, args[0]))
+
+        return _UNBOUNDED
+
+    def make_range_callable(self) -> Callable[[float, float], Interval]:
+        """Return f_range(lo, hi) -> (y_lo, y_hi) enclosing f on [lo, hi]."""
+        def f_range(lo: float, hi: float) -> Interval:
+            return self._eval_range(self.tree, lo, hi)
+        return f_range
+
+
+def _checked(r: Interval) -> Interval:
+    # inf - inf, 0 * inf, ... leave nan behind: fall back to "anything"
+    if r is None:
+        return None
+    if math.isnan(r[0]) or math.isnan(r[1]):
+        return _UNBOUNDED
+    return r
+
+
+def _binop_range(op: ast.operator, a: Tuple[float, float], b: Tuple[float, float]) -> Interval:
+    if isinstance(op, ast.Add):
+        return (a[0] + b[0], a[1] + b[1])
+    if isinstance(op, ast.Sub):
+        return (a[0] - b[1], a[1] - b[0])
+    if isinstance(op, ast.Mult):
+        products = [p * q for p in a for q in b]
+        return (min(products), max(products))
+    if isinstance(op, ast.Div):
+        if b[0] <= 0.0 <= b[1]:
+            return _UNBOUNDED
+        quotients = [p / q for p in a for q in b]
+        return (min(quotients), max(quotients))
+    if isinstance(op, ast.Pow):
+        return _pow_range(a, b)
+    return _UNBOUNDED
+
+
+def _pow_range(a: Tuple[float, float], b: Tuple[float, float]) -> Interval:
+    try:
+        if b[0] == b[1] and float(b[0]).is_integer() and abs(b[0]) <= 1024:
+            n = int(b[0])
+            if n == 0:
+                return (1.0, 1.0)
+            if n < 0 and a[0] <= 0.0 <= a[1]:
+                return _UNBOUNDED
+            ends = [a[0] ** n, a[1] ** n]
+            if n % 2 == 0 and a[0] <= 0.0 <= a[1]:
+                return (0.0, max(ends))
+            return (min(ends), max(ends))
+        if a[0] > 0.0:
+            # positive base: monotone in both base and exponent
+            corners = [p ** q for p in a for q in b]
+            return (min(corners), max(corners))
+    except (OverflowError, ZeroDivisionError):
+        pass
+    return _UNBOUNDED
+
+
+def _call_range(name: str, r: Tuple[float, float]) -> Interval:
+    lo, hi = r
+    if name in ("sin", "cos"):
+        if not (math.isfinite(lo) and math.isfinite(hi)):
+            return (-1.0, 1.0)
+        # cos(x) = sin(x + pi/2)
+        shift = math.pi / 2 if name == "cos" else 0.0
+        return _sin_range(lo + shift, hi + shift)
+    if name == "tan":
+        if not (math.isfinite(lo) and math.isfinite(hi)) or hi - lo >= math.pi:
+            return _UNBOUNDED
+        # a pole at pi/2 + k*pi inside the interval makes it unbounded
+        k = math.ceil((lo - math.pi / 2) / math.pi)
+        if math.pi / 2 + k * math.pi <= hi:
+            return _UNBOUNDED
+        return (math.tan(lo), math.tan(hi))
+    if name == "exp":
+        try:
+            bottom = math.exp(lo)
+        except OverflowError:
+            return None  # overflows (fails) everywhere on the interval
+        try:
+            top = math.exp(hi)
+        except OverflowError:
+            top = _INF
+        return (bottom, top)
+    if name == "log":
+        if hi <= 0.0:
+            return None
+        return (math.log(lo) if lo > 0.0 else -_INF, math.log(hi))
+    if name == "sqrt":
+        if hi < 0.0:
+            return None
+        return (math.sqrt(lo) if lo > 0.0 else 0.0, math.sqrt(hi))
+    if name == "abs":
+        if lo >= 0.0:
+            return (lo, hi)
+        if hi <= 0.0:
+            return (-hi, -lo)
+        return (0.0, max(-lo, hi))
+    if name in ("floor", "ceil"):
+        fn = math.floor if name == "floor" else math.ceil
+        return (
+            float(fn(lo)) if math.isfinite(lo) else lo,
+            float(fn(hi)) if math.isfinite(hi) else hi,
+        )
+    return _UNBOUNDED
+
+
+def _sin_range(lo: float, hi: float) -> Tuple[float, float]:
+    if hi - lo >= 2 * math.pi:
+        return (-1.0, 1.0)
+    ends = [math.sin(lo), math.sin(hi)]
+    y_lo, y_hi = min(ends), max(ends)
+    # peaks at pi/2 + 2k*pi, troughs at -pi/2 + 2k*pi
+    if math.ceil((lo - math.pi / 2) / (2 * math.pi)) <= (hi - math.pi / 2) / (2 * math.pi):
+        y_hi = 1.0
+    if math.ceil((lo + math.pi / 2) / (2 * math.pi)) <= (hi + math.pi / 2) / (2 * math.pi):
+        y_lo = -1.0
+    return (y_lo, y_hi)
+
 
 def build_function(expr: str) -> Callable[[float], float]:
     """
@@ -215,3 +389,13 @@ def build_function(expr: str) -> Callable[[float], float]:
     """
     evaluator = SafeEvaluator(expr)
     return evaluator.make_callable()
+
+
+def build_range_function(expr: str) -> Callable[[float, float], Interval]:
+    """
+    Parse and return f_range(lo, hi): bounds on f(x) for x in [lo, hi]
+    (interval arithmetic), or None if f is defined nowhere on it.
+    Raises FunctionParseError on invalid input.
+    """
+    evaluator = SafeEvaluator(expr)
+    return evaluator.make_range_callable()
@@ -1,7 +1,8 @@
 # src/coordle/geometry.py
 
+import heapq
 import math
-from typing import Callable, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 
 def min_distance_curve_to_point(
@@ -10,14 +11,28 @@ def min_distance_curve_to_point(
     x_min: float,
     x_max: float,
     n_samples: int,
+    progressive: bool = False,
+    eps: Optional[float] = None,
+    f_range: Optional["RangeFunction"] = None,
 ) -> Tuple[float, float, float]:
     """
     Approximate the minimum Euclidean distance between the curve y=f(x)
     and a single point (x0, y0) over x in [x_min, x_max].
 
+    With progressive=True the grid is searched branch-and-bound style,
+    skipping stretches that provably can't be closer (tighter with f_range),
+    and stops early on a hit within eps
+    (see progressive_min_distance for the error bound / eval count).
+
     Returns:
         (min_dist, x_at_min, y_at_min)
     """
+    if progressive:
+        est = progressive_min_distance(
+            f, point, x_min, x_max, n_samples, eps=eps, f_range=f_range
+        )
+        return est.dist, est.x_at_min, est.y_at_min
+
     x0, y0 = point
     if n_samples < 2:
         raise ValueError("n_samples must be at least 2")
@@ -50,3 +65,135 @@ def min_distance_curve_to_point(
             y_at_min = y
 
     return min_dist, x_at_min, y_at_min
+
+
+class DistanceEstimate(NamedTuple):
+    dist: float
+    x_at_min: float
+    y_at_min: float
+    error_bound: float  # dist minus a guaranteed lower bound on the grid minimum
+    n_evals: int  # calls to f plus calls to f_range
+
+
+# Enclosure of f on [lo, hi] (see functions.build_range_function):
+# (y_lo, y_hi), or None when f is defined nowhere on the interval.
+RangeFunction = Callable[[float, float], Optional[Tuple[float, float]]]
+
+# pruning margin, so float rounding in the enclosure never drops a minimum
+_PRUNE_SLACK = 1e-9
+
+
+def progressive_min_distance(
+    f: Callable[[float], float],
+    point: Tuple[float, float],
+    x_min: float,
+    x_max: float,
+    n_samples: int,
+    eps: Optional[float] = None,
+    coarse_samples: int = 64,
+    f_range: Optional[RangeFunction] = None,
+) -> DistanceEstimate:
+    """
+    Branch-and-bound version of min_distance_curve_to_point on the same grid.
+
+    Samples a coarse subset of the grid, then repeatedly takes the interval
+    between samples with the smallest lower bound and bisects it. An
+    interval is dropped once its lower bound can't beat the best sample,
+    bounding the curve inside it by f_range (or only by its x extent when
+    f_range is None). Without eps the result is exactly the full-scan
+    minimum, so a clear miss costs far fewer evaluations but scores the
+    same.
+
+    With eps, it also stops as soon as a sample is within eps: the hit is
+    decided, and error_bound says how much closer the curve might still get.
+    """
+    x0, y0 = point
+    if n_samples < 2:
+        raise ValueError("n_samples must be at least 2")
+
+    step = (x_max - x_min) / (n_samples - 1)
+    last = n_samples - 1
+    n_evals = 0
+
+    best_i, best_d = -1, float("inf")
+    # index -> (x, y), None where f fails
+    samples: Dict[int, Optional[Tuple[float, float]]] = {}
+
+    def sample(i: int) -> None:
+        nonlocal n_evals, best_i, best_d
+        if i in samples:
+            return
+        n_evals += 1
+        x = x_min + i * step
+        try:
+            y = f(x)
+        except Exception:
+            y = None
+        if y is None or isinstance(y, complex) or not math.isfinite(y):
+            samples[i] = None
+            return
+        samples[i] = (x, y)
+        d = math.hypot(x - x0, y - y0)
+        if d < best_d or (d == best_d and i < best_i):
+            best_i, best_d = i, d
+
+    def lower_bound(a: int, b: int) -> Optional[float]:
+        # smallest possible distance for grid points strictly inside (a, b);
+        # None if there are none, or f is defined at none of them
+        nonlocal n_evals
+        if b - a < 2:
+            return None
+        xa, xb = x_min + (a + 1) * step, x_min + (b - 1) * step
+        dx = max(xa - x0, 0.0, x0 - xb)
+        if f_range is None:
+            return dx
+        n_evals += 1
+        try:
+            y_range = f_range(xa, xb)
+        except Exception:
+            y_range = (-math.inf, math.inf)
+        if y_range is None:
+            return None
+        dy = max(y_range[0] - y0, 0.0, y0 - y_range[1])
+        return math.hypot(dx, dy)
+
+    stride = 1
+    while last // (stride * 2) >= coarse_samples:
+        stride *= 2
+
+    edges = list(range(0, last, stride)) + [last]
+    for i in edges:
+        sample(i)
+
+    heap: List[Tuple[float, int, int]] = []
+
+    def push(a: int, b: int) -> None:
+        lb = lower_bound(a, b)
+        if lb is not None:
+            heapq.heappush(heap, (lb, a, b))
+
+    for a, b in zip(edges, edges[1:]):
+        push(a, b)
+
+    while heap:
+        lb, a, b = heap[0]
+        if lb * (1.0 - _PRUNE_SLACK) - _PRUNE_SLACK >= best_d:
+            # nothing left can beat the best sample
+            heap.clear()
+            break
+        if eps is not None and best_d < eps:
+            break
+        heapq.heappop(heap)
+        mid = (a + b) // 2
+        sample(mid)
+        push(a, mid)
+        push(mid, b)
+
+    if best_i < 0:
+        return DistanceEstimate(float("inf"), float("nan"), float("nan"), 0.0, n_evals)
+
+    # what's left in the heap could still hold something closer
+    error_bound = max(0.0, best_d - heap[0][0]) if heap else 0.0
+
+    x_at_min, y_at_min = samples[best_i]
+    return DistanceEstimate(best_d, x_at_min, y_at_min, error_bound, n_evals)
@@ -0,0 +1,276 @@
+# src/coordle/limits.py
+
+from __future__ import annotations
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+import threading
+import time
+
+
+class RateLimited(Exception):
+    """Raised when a client has no budget left or too much work queued."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limited, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+@dataclass
+class TokenBucket:
+    """
+    Budget measured in seconds of work, not requests.
+
+    Work is charged after it has run (its cost isn't known up front), so
+    the balance can go negative; the client is blocked until it refills
+    back above zero.
+    """
+    capacity: float
+    refill_rate: float  # seconds of budget regained per second
+    tokens: float
+    updated: float
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated = now
+
+    def retry_after(self, now: float) -> float:
+        """0 if the client may run work now, else seconds until it can."""
+        self.refill(now)
+        if self.tokens > 0:
+            return 0.0
+        return -self.tokens / self.refill_rate
+
+    def charge(self, cost: float, now: float) -> None:
+        self.refill(now)
+        self.tokens -= cost
+
+
+@dataclass
+class ClientStats:
+    requests: int = 0
+    throttled: int = 0
+    cost: float = 0.0  # total seconds of work charged
+    queued: int = 0
+
+
+class CostLimiter:
+    """
+    Per-client token buckets charged by measured evaluation/render time.
+    Also keeps a running cost per game_id (most recent max_games only).
+
+    Clients idle for idle_ttl seconds whose bucket has refilled are
+    dropped: a full bucket is the same as a fresh one, so forgetting
+    them can't hand anyone extra budget.
+    """
+
+    def __init__(
+        self,
+        capacity: float = 2.0,
+        refill_rate: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        idle_ttl: float = 600.0,
+        max_games: int = 1000,
+    ):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.clock = clock
+        self.idle_ttl = idle_ttl
+        self.max_games = max_games
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, ClientStats] = {}
+        self._game_cost: "OrderedDict[str, float]" = OrderedDict()
+        self._last_prune = clock()
+
+    def _bucket(self, client_id: str) -> TokenBucket:
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            now = self.clock()
+            # only new clients can grow the table, so prune on their way in
+            if now - self._last_prune >= min(self.idle_ttl, 1.0):
+                self._prune(now)
+            bucket = TokenBucket(self.capacity, self.refill_rate, self.capacity, now)
+            self._buckets[client_id] = bucket
+            self._stats[client_id] = ClientStats()
+        return bucket
+
+    def _prune(self, now: float) -> None:
+        self._last_prune = now
+        for client_id in list(self._buckets):
+            bucket = self._buckets[client_id]
+            if now - bucket.updated < self.idle_ttl or self._stats[client_id].queued:
+                continue
+            bucket.refill(now)
+            if bucket.tokens >= self.capacity:
+                del self._buckets[client_id]
+                del self._stats[client_id]
+
+    def check(self, client_id: str) -> None:
+        """Count a request, raising RateLimited if the client is out of budget."""
+        with self._lock:
+            bucket = self._bucket(client_id)
+            stats = self._stats[client_id]
+            stats.requests += 1
+            wait = bucket.retry_after(self.clock())
+            if wait > 0:
+                stats.throttled += 1
+                raise RateLimited(wait)
+
+    def throttle(self, client_id: str, retry_after: float) -> None:
+        """Record a rejection decided elsewhere (e.g. a full queue)."""
+        with self._lock:
+            self._bucket(client_id)
+            self._stats[client_id].throttled += 1
+        raise RateLimited(retry_after)
+
+    def charge(self, client_id: str, cost: float, game_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._bucket(client_id).charge(cost, self.clock())
+            self._stats[client_id].cost += cost
+            if game_id is not None:
+                self._game_cost[game_id] = self._game_cost.get(game_id, 0.0) + cost
+                self._game_cost.move_to_end(game_id)
+                while len(self._game_cost) > self.max_games:
+                    self._game_cost.popitem(last=False)
+
+    def set_queued(self, client_id: str, queued: int) -> None:
+        with self._lock:
+            self._bucket(client_id)
+            self._stats[client_id].queued = queued
+
+    def snapshot(self, top: int = 20) -> Dict[str, Any]:
+        """Heaviest clients first, plus the most expensive games."""
+        with self._lock:
+            now = self.clock()
+            clients = []
+            for client_id, stats in self._stats.items():
+                bucket = self._buckets[client_id]
+                bucket.refill(now)
+                clients.append({
+                    "client_id": client_id,
+                    "requests": stats.requests,
+                    "throttled": stats.throttled,
+                    "cost": round(stats.cost, 4),
+                    "tokens": round(bucket.tokens, 4),
+                    "queued": stats.queued,
+                })
+            games = sorted(self._game_cost.items(), key=lambda kv: kv[1], reverse=True)
+
+        clients.sort(key=lambda c: (c["throttled"], c["cost"]), reverse=True)
+        return {
+            "clients": clients[:top],
+            "games": [{"game_id": g, "cost": round(c, 4)} for g, c in games[:top]],
+        }
+
+
+@dataclass
+class _Task:
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    game_id: Optional[str]
+    min_cost: float = 0.0
+    future: Future = field(default_factory=Future)
+
+
+class FairScheduler:
+    """
+    Runs work on a fixed pool of worker threads, taking one task per
+    client in turn (round-robin), so a client with a long queue can't
+    starve everyone else. Each task's thread CPU time is charged to the
+    client through the limiter.
+    """
+
+    def __init__(
+        self,
+        limiter: CostLimiter,
+        workers: int = 2,
+        max_queued_per_client: int = 4,
+    ):
+        self.limiter = limiter
+        self.max_queued_per_client = max_queued_per_client
+        self._cond = threading.Condition()
+        self._queues: Dict[str, Deque[_Task]] = {}
+        # clients with pending work, in the order they get served
+        self._rotation: Deque[str] = deque()
+        self._threads: List[threading.Thread] = []
+        for i in range(workers):
+            t = threading.Thread(target=self._worker, name=f"coordle-eval-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(
+        self,
+        client_id: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        game_id: Optional[str] = None,
+        min_cost: float = 0.0,
+    ) -> Future:
+        """
+        Queue fn(*args) for client_id. Raises RateLimited if the client
+        is out of budget or already has too much queued.
+        min_cost is charged instead of the measured time when that is
+        lower, for calls that are cheap to run but not free to keep.
+        """
+        self.limiter.check(client_id)
+
+        task = _Task(fn=fn, args=args, game_id=game_id, min_cost=min_cost)
+        with self._cond:
+            queue = self._queues.setdefault(client_id, deque())
+            if len(queue) >= self.max_queued_per_client:
+                self.limiter.throttle(client_id, retry_after=1.0)
+            if not queue:
+                self._rotation.append(client_id)
+            queue.append(task)
+            self.limiter.set_queued(client_id, len(queue))
+            self._cond.notify()
+        return task.future
+
+    def run(
+        self,
+        client_id: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        game_id: Optional[str] = None,
+        min_cost: float = 0.0,
+    ) -> Any:
+        """Blocking submit(): wait for the result (or re-raise its exception)."""
+        return self.submit(client_id, fn, *args, game_id=game_id, min_cost=min_cost).result()
+
+    def _next_task(self) -> Tuple[str, _Task]:
+        with self._cond:
+            while not self._rotation:
+                self._cond.wait()
+            client_id = self._rotation.popleft()
+            queue = self._queues[client_id]
+            task = queue.popleft()
+            if queue:
+                self._rotation.append(client_id)
+            else:
+                del self._queues[client_id]
+            self.limiter.set_queued(client_id, len(queue))
+            return client_id, task
+
+    def _worker(self) -> None:
+        while True:
+            client_id, task = self._next_task()
+            if not task.future.set_running_or_notify_cancel():
+                continue
+
+            start = time.thread_time()
+            error: Optional[BaseException] = None
+            try:
+                result = task.fn(*task.args)
+            except BaseException as e:
+                error = e
+
+            # charge before resolving, so the client's next request sees the cost
+            cost = max(time.thread_time() - start, task.min_cost)
+            self.limiter.charge(client_id, cost, game_id=task.game_id)
+            if error is not None:
+                task.future.set_exception(error)
+            else:
+                task.future.set_result(result)
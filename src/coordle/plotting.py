@@ -1,15 +1,31 @@
 # src/coordle/plotting.py
 
 import io
+from functools import lru_cache
 from typing import Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
+from PIL import Image
 
 from .functions import build_function
 from .config import GameConfig
 
 
+# Square edge lengths in pixels. Kept to a fixed set so responses cache well.
+IMAGE_SIZES = (128, 256, 400)
+DEFAULT_IMAGE_SIZE = 400
+
+IMAGE_MEDIA_TYPES = {
+    "png": "image/png",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+}
+
+# curve + two dots on white; 32 colours keeps the antialiasing smooth
+_PALETTE_COLORS = 32
+
+
 def create_attempt_image(
     expr: str,
     target: Tuple[float, float],
@@ -17,20 +33,57 @@ def create_attempt_image(
     y_at_min: float | None,
     config: GameConfig,
     show_target: bool = False,
+    size: int = DEFAULT_IMAGE_SIZE,
+    fmt: str = "png",
+    cache: bool = True,
 ) -> bytes:
     """
-    Returns a PNG image as bytes:
+    Returns a size x size image (png / webp / svg, see IMAGE_MEDIA_TYPES) as bytes:
       - curve from user expression
       - dot on curve where it's closest
       - optional target point (shown after game finished)
     Fully clean: no axes, no numbers, no labels.
-    """
 
+    Renders are cached, so repeat fetches only pay for matplotlib once.
+    Pass cache=False for images the caller keeps itself, so they don't
+    push players' renders out of the shared cache.
+    """
+    if size not in IMAGE_SIZES:
+        raise ValueError(f"size must be one of {IMAGE_SIZES}")
+    if fmt not in IMAGE_MEDIA_TYPES:
+        raise ValueError(f"fmt must be one of {tuple(IMAGE_MEDIA_TYPES)}")
+
+    render = _render_attempt_image if cache else _render_attempt_image.__wrapped__
+    return render(
+        expr,
+        tuple(target),
+        x_at_min,
+        y_at_min,
+        config.x_min,
+        config.x_max,
+        show_target,
+        size,
+        fmt,
+    )
+
+
+@lru_cache(maxsize=512)
+def _render_attempt_image(
+    expr: str,
+    target: Tuple[float, float],
+    x_at_min: float | None,
+    y_at_min: float | None,
+    x_min: float,
+    x_max: float,
+    show_target: bool,
+    size: int,
+    fmt: str,
+) -> bytes:
     # 1. Rebuild function
     f = build_function(expr)
 
     # 2. Generate x values
-    xs = np.linspace(config.x_min, config.x_max, 600)
+    xs = np.linspace(x_min, x_max, 600)
     ys = []
 
     for x in xs:
@@ -46,13 +99,14 @@ def create_attempt_image(
     xs = np.array(xs)
     ys = np.array(ys)
 
-    # 3. Create a clean figure
-    fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
+    # 3. Create a clean figure (4in at size/4 dpi -> size px,
+    #    line widths / markers are in points so they scale along)
+    fig, ax = plt.subplots(figsize=(4, 4), dpi=size / 4)
 
     # Plot curve
     ax.plot(xs, ys, linewidth=1.5)
 
-        # Plot closest point (if valid)
+    # Plot closest point (if valid)
     if x_at_min is not None and y_at_min is not None:
         ax.scatter([x_at_min], [y_at_min], color="blue", s=40, zorder=3)
 
@@ -61,14 +115,27 @@ def create_attempt_image(
         x0, y0 = target
         ax.scatter([x0], [y0], color="red", s=45, zorder=4)
 
-    # Remove all axes
+    # Remove all axes, fill the whole canvas
+    # (cheaper than bbox_inches="tight", which renders twice)
     ax.set_axis_off()
-
-    plt.tight_layout()
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
 
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight", pad_inches=0)
+    if fmt == "svg":
+        fig.savefig(buf, format="svg")
+        plt.close(fig)
+        return buf.getvalue()
+
+    fig.savefig(buf, format="png")
     plt.close(fig)
-    buf.seek(0)
 
-    return buf.getvalue()
+    buf.seek(0)
+    img = Image.open(buf).convert("RGB")
+
+    out = io.BytesIO()
+    if fmt == "webp":
+        img.save(out, format="WEBP", quality=80, method=4)
+    else:
+        # palette-encode: a few dozen colours is plenty for this plot
+        img.quantize(colors=_PALETTE_COLORS).save(out, format="PNG", optimize=True)
+    return out.getvalue()
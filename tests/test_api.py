@@ -0,0 +1,182 @@
+# tests/test_api.py
+
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from coordle import api
+from coordle.api import app
+from coordle.daily import COMMON_GUESSES, get_daily_puzzle, today_utc
+from coordle.plotting import _render_attempt_image
+
+
+client = TestClient(app)
+
+
+def test_new_game_guess_image():
+    res = client.post("/new-game")
+    assert res.status_code == 200
+    game = res.json()
+
+    target_y = game["solution_point"]["y"]
+    res = client.post("/guess", json={"game_id": game["game_id"], "expr": f"{target_y}"})
+    assert res.status_code == 200
+    data = res.json()
+    assert data["hit"]
+    assert data["finished"]
+    assert data["attempts_used"] == 1
+    assert data["attempts_left"] == game["max_attempts"] - 1
+    assert data["n_evals"] > 0
+    assert data["dist_error"] >= 0
+
+    res = client.get(data["image_url"])
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "image/png"
+    assert res.content.startswith(b"\x89PNG")
+
+
+def test_guess_unknown_game():
+    res = client.post("/guess", json={"game_id": "nope", "expr": "x"})
+    assert res.status_code == 404
+
+
+def test_ws_game_new_game_and_guess():
+    with client.websocket_connect("/ws/game") as ws:
+        game = ws.receive_json()
+        assert game["type"] == "new-game"
+
+        ws.send_json({"type": "guess", "expr": "x"})
+        data = ws.receive_json()
+        assert data["type"] == "guess"
+        assert data["attempts_used"] == 1
+        assert data["error"] is None
+
+        img = ws.receive_bytes()
+        assert img.startswith(b"\x89PNG")
+
+
+def test_ws_bad_frames_get_error_and_keep_the_game():
+    with client.websocket_connect("/ws/game") as ws:
+        assert ws.receive_json()["type"] == "new-game"
+
+        ws.send_text("not json")
+        assert ws.receive_json()["type"] == "error"
+        ws.send_bytes(b"\x00")
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json([1, 2])
+        assert ws.receive_json()["type"] == "error"
+
+        ws.send_json({"type": "guess", "expr": "x"})
+        assert ws.receive_json()["type"] == "guess"
+        assert ws.receive_bytes().startswith(b"\x89PNG")
+
+
+def test_ws_initial_game_is_charged():
+    player = TestClient(app, client=("10.0.2.1", 50000))
+    with player.websocket_connect("/ws/game") as ws:
+        assert ws.receive_json()["type"] == "new-game"
+
+    clients = api.LIMITER.snapshot(top=1000)["clients"]
+    charged = next(c for c in clients if c["client_id"] == "10.0.2.1")
+    assert charged["cost"] >= api.NEW_GAME_COST
+
+
+def test_daily_rejects_dates_outside_range():
+    assert client.get("/daily/2000-01-01").status_code == 404
+    assert client.get("/daily/9999-01-01").status_code == 404
+    assert client.get("/daily/not-a-date").status_code == 400
+
+
+def test_daily_today_and_new_game_share_target():
+    player = TestClient(app, client=("10.0.1.1", 50000))
+    res = player.get("/daily")
+    assert res.status_code == 200
+    puzzle = res.json()
+    assert puzzle["day"] == today_utc().isoformat()
+    assert len(puzzle["common_guesses"]) == len(COMMON_GUESSES)
+
+    cache = res.headers["Cache-Control"]
+    assert cache.startswith("public, max-age=")
+    assert 0 < int(cache.rsplit("=", 1)[1]) <= 86400
+
+    res = player.get(f"/daily/{puzzle['day']}")
+    assert res.status_code == 200
+    assert res.headers["Cache-Control"].startswith("public, max-age=")
+    assert "immutable" not in res.headers["Cache-Control"]
+
+    game = player.post("/new-game", params={"daily": "true"}).json()
+    assert game["solution_point"] == puzzle["solution_point"]
+
+
+def test_daily_past_day_is_immutable_and_images_stay_on_the_puzzle():
+    player = TestClient(app, client=("10.0.1.2", 50000))
+    res = player.get("/daily/2025-06-01")
+    assert res.status_code == 200
+    assert res.json()["day"] == "2025-06-01"
+    assert res.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    image_url = res.json()["common_guesses"][1]["image_url"]
+    res = player.get(image_url, params={"size": 128})
+    assert res.status_code == 200
+    assert res.content.startswith(b"\x89PNG")
+
+    # served from the puzzle itself, whatever happens to the shared render cache
+    _render_attempt_image.cache_clear()
+    puzzle = get_daily_puzzle(date(2025, 6, 1))
+    assert puzzle.images[(1, 128, "png")] == res.content
+    assert player.get(image_url, params={"size": 128}).content == res.content
+    assert _render_attempt_image.cache_info().currsize == 0
+
+
+def test_image_size_and_format_params():
+    game = client.post("/new-game").json()
+    data = client.post("/guess", json={"game_id": game["game_id"], "expr": "x + 30"}).json()
+
+    res = client.get(data["image_url"], params={"size": 128, "fmt": "webp"})
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "image/webp"
+
+    res = client.get(data["image_url"], params={"fmt": "svg"})
+    assert res.headers["content-type"] == "image/svg+xml"
+
+    assert client.get(data["image_url"], params={"size": 300}).status_code == 400
+    assert client.get(data["image_url"], params={"fmt": "gif"}).status_code == 400
+
+
+def test_stats_is_local_only():
+    assert client.get("/stats").status_code == 403
+
+    local = TestClient(app, client=("127.0.0.1", 50000))
+    res = local.get("/stats")
+    assert res.status_code == 200
+    assert "clients" in res.json()
+
+
+def test_new_game_over_cap_is_rejected_not_evicting(monkeypatch):
+    monkeypatch.setattr(api, "MAX_GAMES_PER_CLIENT", 2)
+    local = TestClient(app, client=("10.0.0.7", 50000))
+
+    ids = [local.post("/new-game").json()["game_id"] for _ in range(2)]
+    res = local.post("/new-game")
+    assert res.status_code == 429
+    assert "Retry-After" in res.headers
+    assert all(game_id in api.GAMES for game_id in ids)
+
+
+def test_new_game_drops_idle_games_to_make_room(monkeypatch):
+    monkeypatch.setattr(api, "MAX_GAMES_PER_CLIENT", 2)
+    local = TestClient(app, client=("10.0.0.8", 50000))
+
+    ids = [local.post("/new-game").json()["game_id"] for _ in range(2)]
+    api._GAME_LAST_USED[ids[0]] -= api.GAME_IDLE_TTL + 1
+
+    res = local.post("/new-game")
+    assert res.status_code == 200
+    assert ids[0] not in api.GAMES
+    assert ids[1] in api.GAMES and res.json()["game_id"] in api.GAMES
+
+
+def test_cors_exposes_retry_after():
+    res = client.post("/guess", json={"game_id": "nope", "expr": "x"},
+                      headers={"Origin": "https://ughgam.github.io"})
+    assert "retry-after" in res.headers["access-control-expose-headers"].lower()
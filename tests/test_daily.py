@@ -0,0 +1,32 @@
+# tests/test_daily.py
+
+from datetime import date
+
+from coordle.config import server_config
+from coordle.daily import COMMON_GUESSES, daily_seed, get_daily_puzzle
+from coordle.engine import CoordinateWordleEngine
+
+
+def test_daily_puzzle_matches_seeded_engine():
+    day = date(2025, 6, 1)
+    puzzle = get_daily_puzzle(day)
+    engine = CoordinateWordleEngine(config=server_config(), seed=daily_seed(day))
+
+    assert puzzle.target == engine.state.target
+    assert get_daily_puzzle(day) is puzzle
+    assert daily_seed(day) != daily_seed(date(2025, 6, 2))
+
+
+def test_daily_reference_solution_hits():
+    puzzle = get_daily_puzzle(date(2025, 6, 1))
+    assert puzzle.reference.hit
+    assert set(puzzle.common) == set(COMMON_GUESSES)
+
+
+def test_daily_common_guesses_match_player_scores():
+    puzzle = get_daily_puzzle(date(2025, 6, 1))
+    engine = CoordinateWordleEngine(config=server_config())
+    engine.state.target = puzzle.target
+
+    result = engine.submit_guess("x**2")
+    assert result.dist == puzzle.common["x**2"].dist
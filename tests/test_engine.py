@@ -15,3 +15,20 @@ def test_engine_basic():
     assert engine.has_won()
     assert result.x_at_min is not None
 
+
+def test_engine_seeded_target_is_deterministic():
+    a = CoordinateWordleEngine(config=GameConfig(), seed=1234)
+    b = CoordinateWordleEngine(config=GameConfig(), seed=1234)
+    c = CoordinateWordleEngine(config=GameConfig(), seed=4321)
+    assert a.state.target == b.state.target
+    assert a.state.target != c.state.target
+
+
+def test_engine_progressive_uses_fewer_evals_on_clear_miss():
+    engine = CoordinateWordleEngine(config=GameConfig(progressive=True))
+    engine.state.target = (0.0, 0.0)
+
+    result = engine.submit_guess("15")
+    assert not result.hit
+    assert abs(result.dist - 15.0) < 1e-3
+    assert result.n_evals < engine.config.n_samples
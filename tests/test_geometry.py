@@ -0,0 +1,92 @@
+# tests/test_geometry.py
+
+import math
+
+import pytest
+
+from coordle.functions import build_function, build_range_function
+from coordle.geometry import min_distance_curve_to_point, progressive_min_distance
+
+
+def _progressive(expr, target, eps=0.2):
+    return progressive_min_distance(
+        build_function(expr),
+        target,
+        -20,
+        20,
+        2000,
+        eps=eps,
+        f_range=build_range_function(expr),
+    )
+
+
+def test_progressive_matches_full_scan_on_hit():
+    f = build_function("x**2 - 4*x")
+    target = (2.0, -4.0)
+    full, _, _ = min_distance_curve_to_point(f, target, -20, 20, 2000)
+    est = progressive_min_distance(f, target, -20, 20, 2000, eps=0.2)
+    assert full < 0.2
+    assert est.dist < 0.2
+    assert est.n_evals < 2000
+
+
+@pytest.mark.parametrize(
+    "expr, target",
+    [
+        # narrow spike between coarse samples
+        ("2.7230*exp(-((x-6.05286)/0.0211)**2) - 2.7230 - 0.05*(x-4.436)**2", (6.05286, 0.0)),
+        # semicircles: undefined at most coarse samples
+        ("sqrt(0.25-(x-3.1)**2) + 1", (3.1, 1.5)),
+        ("sqrt(0.25-(x-3.1)**2) + 1", (3.1, 2.5)),
+        ("sqrt(9-(x+2)**2) - 4", (0.5, -1.7)),
+        # partial domains and poles
+        ("log(x)", (0.05, -3.0)),
+        ("1/x", (-7.5, 4.0)),
+        ("tan(x)", (1.5, 3.0)),
+        # faster than the coarse grid
+        ("4*sin(40*x)", (3.022340913665559, -3.7269965682047275)),
+        ("4*sin(40*x)", (6.0, 9.0)),
+        ("x if x > 0 else -x", (-4.0, 4.1)),
+        ("15", (0.0, 0.0)),
+    ],
+)
+def test_progressive_agrees_with_full_scan(expr, target):
+    full, _, _ = min_distance_curve_to_point(build_function(expr), target, -20, 20, 2000)
+    est = _progressive(expr, target)
+
+    assert (est.dist < 0.2) == (full < 0.2)
+    if full >= 0.2:
+        # a miss is scored exactly like the full scan
+        assert est.dist == full
+        assert est.error_bound == 0.0
+    assert 0.0 <= est.dist - full <= est.error_bound
+
+
+def test_progressive_without_eps_is_exact_and_cheaper():
+    expr = "sin(x) + x/2"
+    target = (1.0, 5.0)
+    full = min_distance_curve_to_point(build_function(expr), target, -20, 20, 2000)
+    est = _progressive(expr, target, eps=None)
+    assert est.dist == full[0]
+    assert est.error_bound == 0.0
+    assert est.n_evals < 2000
+
+
+def test_progressive_error_bound_on_early_hit():
+    est = _progressive("0", (0.0, 0.0))
+    assert est.dist < 0.2
+    assert est.error_bound <= est.dist
+
+
+def test_progressive_undefined_everywhere():
+    est = _progressive("log(-1 - x*x)", (0.0, 0.0))
+    assert math.isinf(est.dist)
+
+
+def test_range_function_encloses_samples():
+    f = build_function("sin(3*x) * exp(x/5) + sqrt(x)")
+    f_range = build_range_function("sin(3*x) * exp(x/5) + sqrt(x)")
+    lo, hi = f_range(0.5, 2.5)
+    for k in range(101):
+        assert lo <= f(0.5 + 2.0 * k / 100) <= hi
+    assert f_range(-3.0, -1.0) is None  # sqrt undefined on the whole interval
@@ -0,0 +1,115 @@
+# tests/test_limits.py
+
+import threading
+
+from coordle.limits import CostLimiter, FairScheduler, RateLimited
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_limiter_charges_cost_and_refills():
+    clock = FakeClock()
+    limiter = CostLimiter(capacity=1.0, refill_rate=0.5, clock=clock)
+
+    limiter.check("a")
+    limiter.charge("a", 1.5, game_id="g1")
+
+    try:
+        limiter.check("a")
+    except RateLimited as e:
+        assert abs(e.retry_after - 1.0) < 1e-9
+    else:
+        assert False
+
+    limiter.check("b")  # other clients are unaffected
+
+    clock.now = 1.5
+    limiter.check("a")
+
+    snap = limiter.snapshot()
+    assert snap["clients"][0]["client_id"] == "a"
+    assert snap["clients"][0]["throttled"] == 1
+    assert snap["games"] == [{"game_id": "g1", "cost": 1.5}]
+
+
+def test_scheduler_round_robins_between_clients():
+    scheduler = FairScheduler(CostLimiter(capacity=100.0), workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def blocker():
+        started.set()
+        release.wait()
+        order.append("a1")
+
+    first = scheduler.submit("a", blocker)
+    started.wait()
+    futures = [
+        scheduler.submit("a", order.append, "a2"),
+        scheduler.submit("a", order.append, "a3"),
+        scheduler.submit("b", order.append, "b1"),
+    ]
+    release.set()
+
+    first.result(timeout=5)
+    for f in futures:
+        f.result(timeout=5)
+    assert order == ["a1", "a2", "b1", "a3"]
+
+
+def test_scheduler_rejects_long_queues():
+    scheduler = FairScheduler(CostLimiter(capacity=100.0), workers=1, max_queued_per_client=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait()
+
+    scheduler.submit("a", blocker)
+    started.wait()
+    scheduler.submit("a", lambda: None)
+    try:
+        scheduler.submit("a", lambda: None)
+    except RateLimited:
+        pass
+    else:
+        assert False
+    finally:
+        release.set()
+
+
+def test_limiter_forgets_idle_refilled_clients():
+    clock = FakeClock()
+    limiter = CostLimiter(capacity=1.0, refill_rate=0.5, clock=clock, idle_ttl=10.0)
+
+    limiter.check("idle")
+    limiter.check("busy")
+    limiter.charge("busy", 100.0)
+
+    clock.now = 20.0
+    limiter.check("new")  # new client triggers the prune
+
+    ids = {c["client_id"] for c in limiter.snapshot()["clients"]}
+    assert ids == {"busy", "new"}  # "busy" is still in debt, keep it
+
+
+def test_limiter_caps_game_costs():
+    limiter = CostLimiter(max_games=2)
+    for game_id in ("g1", "g2", "g3"):
+        limiter.charge("a", 0.1, game_id=game_id)
+    assert [g["game_id"] for g in limiter.snapshot()["games"]] == ["g2", "g3"]
+
+
+def test_scheduler_charges_min_cost():
+    limiter = CostLimiter(capacity=100.0)
+    scheduler = FairScheduler(limiter, workers=1)
+    scheduler.run("a", lambda: None, min_cost=0.5)
+    assert limiter.snapshot()["clients"][0]["cost"] >= 0.5
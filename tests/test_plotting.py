@@ -0,0 +1,41 @@
+# tests/test_plotting.py
+
+import io
+
+import pytest
+from PIL import Image
+
+from coordle.config import GameConfig
+from coordle.plotting import IMAGE_SIZES, create_attempt_image
+
+
+def _render(**kwargs):
+    return create_attempt_image(
+        expr="sin(x)",
+        target=(1.0, 2.0),
+        x_at_min=1.5,
+        y_at_min=1.0,
+        config=GameConfig(),
+        show_target=True,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("size", IMAGE_SIZES)
+def test_attempt_image_pixel_size(size):
+    img = Image.open(io.BytesIO(_render(size=size)))
+    assert img.size == (size, size)
+    assert img.format == "PNG"
+    assert img.mode == "P"  # palette-encoded
+
+
+def test_attempt_image_formats():
+    assert Image.open(io.BytesIO(_render(fmt="webp"))).format == "WEBP"
+    assert b"<svg" in _render(fmt="svg")
+
+
+def test_attempt_image_rejects_unknown_params():
+    with pytest.raises(ValueError):
+        _render(size=300)
+    with pytest.raises(ValueError):
+        _render(fmt="gif")